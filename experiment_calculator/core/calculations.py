@@ -11,44 +11,69 @@ from experiment_calculator.core.types import (
     ComparisonType,
     ConfidenceIntervalResult,
 )
-from math import ceil
-from itertools import combinations
-from statsmodels.stats.proportion import proportion_effectsize
-from statsmodels.stats.power import tt_ind_solve_power
-from statsmodels.stats import proportion
-from scipy import stats
+from math import asin, ceil, exp, isfinite, sqrt
+from functools import lru_cache
+from scipy import stats, special
+from scipy.optimize import elementwise
 
 #===============================================#
 #--------------- Alpha Functions ---------------#
 #===============================================#
 
-def obrien_fleming_correction(information_fraction:float, alpha:float=0.05) -> float:
+@lru_cache(maxsize=256)
+def _z_two_sided(alpha:float) -> float:
+    """
+    Calculate the critical z-value for a two-sided test at the given alpha.
+
+    Parameters
+    ----------
+    alpha : float
+        Type-I error rate.
+
+    Returns
+    -------
+    float
+        The standard normal quantile at 1 - alpha / 2.
+    """
+    # ndtri is the standard normal quantile ufunc behind stats.norm.ppf, 
+    # without the distribution machinery's argument handling
+    return float(special.ndtri(1 - alpha / 2))
+
+def obrien_fleming_correction(
+    information_fraction:Union[float, np.ndarray],
+    alpha:float=0.05,
+) -> Union[float, np.ndarray]:
     """ 
     Calculate an approximation of the O'Brien-Fleming alpha spending function.
     Function taken from: https://github.com/zalando/expan/blob/master/expan/core/early_stopping.py
 
     Parameters
     ----------
-    information_fraction : float
-        Share of the information amount at the point of evaluation, 
-        e.g., the share of the maximum sample size.
+    information_fraction : float or np.ndarray
+        Share of the information amount at the point(s) of evaluation, 
+        e.g., the share of the maximum sample size. An information fraction
+        of 0 spends no alpha.
     alpha : float
         Type-I error rate.
 
     Returns
     -------
-    float
-        Redistributed alpha value at the time point with the given information fraction.
+    float or np.ndarray
+        Redistributed alpha value at the time point(s) with the given information fraction.
     """
-    return (1 - stats.norm.cdf(stats.norm.ppf(1 - alpha / 2) / np.sqrt(information_fraction))) * 2
+    information_fraction = np.asarray(information_fraction, dtype=np.float64)
+    # an information fraction of 0 gives an infinite z-value, which spends no alpha
+    with np.errstate(divide="ignore"):
+        # ndtr(-z) is the standard normal survival function, evaluated as a plain ufunc
+        return 2.0 * special.ndtr(-_z_two_sided(alpha) / np.sqrt(information_fraction))
 
 def adjusted_alpha(
     base_alpha:float,
     num_comparisons:int,
     multiple_comparisons:MTCType,
     sequential_testing:SequentialType=None,
-    information_fraction:float=None,
-) -> float:
+    information_fraction:Union[float, np.ndarray]=None,
+) -> Union[float, np.ndarray]:
     """
     Calculates and adjusted alpha for multiple comparisons correction and/or
     sequential testing. 
@@ -63,16 +88,43 @@ def adjusted_alpha(
         The type of mulitple comparisons correction to be implemented.
     sequential_testing : str in ["O'Brien-Fleming", "None"]
         The type of sequential testing to be implemented
-    information_fraction : float
+    information_fraction : float or np.ndarray
         The proportion of the experiment that has been completed compared to 
         to total duration of the experiment (used for O'Brien-Fleming correction).
+        An array of fractions returns the adjusted alpha at each interim look.
 
     Returns
     -------
-    float
+    float or np.ndarray
         adjusted alpha
     """
-    assert num_comparisons >= 1
+    if num_comparisons < 1:
+        raise ValueError("The number of comparisons must be at least 1.")
+
+    # arrays of information fractions cannot be hashed, so skip the cache
+    if np.ndim(information_fraction) > 0:
+        return _adjusted_alpha_cached.__wrapped__(
+            base_alpha, num_comparisons, multiple_comparisons, sequential_testing, information_fraction
+        )
+
+    return _adjusted_alpha_cached(
+        base_alpha, num_comparisons, multiple_comparisons, sequential_testing, information_fraction
+    )
+
+@lru_cache(maxsize=1024)
+def _adjusted_alpha_cached(
+    base_alpha:float,
+    num_comparisons:int,
+    multiple_comparisons:MTCType,
+    sequential_testing:SequentialType,
+    information_fraction:Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """
+    Adjusted alpha for adjusted_alpha, memoised on the (scalar) arguments.
+    """
+    # no correction requested, so there is nothing to adjust
+    if multiple_comparisons != "Bonferroni" and sequential_testing != "O'Brien-Fleming":
+        return base_alpha
 
     if multiple_comparisons == "Bonferroni":
         alpha = base_alpha / num_comparisons
@@ -82,7 +134,7 @@ def adjusted_alpha(
     if sequential_testing == "O'Brien-Fleming":
         alpha = obrien_fleming_correction(information_fraction=information_fraction, alpha=alpha)
         # set a minimum value for alpha in case the above calculation is 0
-        alpha = max(alpha, 0.0000000000001)
+        alpha = np.maximum(alpha, 0.0000000000001)
 
     return alpha
 
@@ -120,6 +172,16 @@ def minimum_detectable_effect(
     return mde_input / 100
 
 
+def _arcsine_effect_size(proportion_1:float, proportion_2:float) -> float:
+    """
+    Cohen's h for two proportions, i.e. statsmodels' proportion_effectsize
+    with method="normal", evaluated with scalar math.
+    """
+    # proportions outside [0, 1] have no arcsine transform, matching statsmodels' nan
+    if not (0 <= proportion_1 <= 1 and 0 <= proportion_2 <= 1):
+        return float("nan")
+    return 2 * (asin(sqrt(proportion_1)) - asin(sqrt(proportion_2)))
+
 def binary_effect_size(
     effect_type:EffectType,
     baseline_mean:float,
@@ -147,16 +209,16 @@ def binary_effect_size(
     assert effect_type in ("Absolute Effect", "Relative Effect")
     if effect_type == "Absolute Effect":
         proportion_1 = baseline_mean + mde
-        return proportion_effectsize(prop1=proportion_1, prop2=baseline_mean, method="normal")
+        return _arcsine_effect_size(proportion_1, baseline_mean)
 
     proportion_1 = (1 + mde) * baseline_mean
-    return proportion_effectsize(prop1=proportion_1, prop2=baseline_mean, method="normal")
+    return _arcsine_effect_size(proportion_1, baseline_mean)
 
 def convert_effect_size_for_binary_outcome(
     effect_type:EffectType,
-    effect_size:float,
+    effect_size:Union[float, np.ndarray],
     prop1:float,
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Converts the effect size to an absolute or relative effect for a binomially 
     distributed sample. 
@@ -166,29 +228,29 @@ def convert_effect_size_for_binary_outcome(
     effect_type : str
         String of either 'Absolute Effect' or 'Relative Effect' indicating
         the type of minimum detectable effect being measured  in the experiment.
-    effect_size : float
-        The effect size to be converted for the appropriate effect type.
+    effect_size : float or np.ndarray
+        The effect size(s) to be converted for the appropriate effect type.
     prop1 : float
         The proportion (response rate) for the first group.
 
     Returns
     -------
-    float
+    float or np.ndarray
         The effect size converted to an absolute or relative effect. 
     """
-    delta = effect_size * np.sqrt(prop1 * (1 - prop1))
+    delta = effect_size * sqrt(prop1 * (1 - prop1))
     prop2 = np.clip(prop1 + delta, 0, 1) 
 
     if effect_type == "Absolute Effect":
-        return round((prop2 - prop1) * 100, 2)
-    return round((prop2 / prop1 - 1) * 100, 2)
+        return np.round((prop2 - prop1) * 100, 2)
+    return np.round((prop2 / prop1 - 1) * 100, 2)
 
 def convert_effect_size_for_normal_outcome(
     effect_type:EffectType,
-    effect_size:float,
+    effect_size:Union[float, np.ndarray],
     baseline_mean:float,
     baseline_stdev:float,
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Converts the effect size from Cohen's D to an absolute or relative effect. 
     
@@ -197,8 +259,8 @@ def convert_effect_size_for_normal_outcome(
     effect_type : str
         String of either 'Absolute Effect' or 'Relative Effect' indicating
         the type of minimum detectable effect being measured  in the experiment.
-    effect_size : float
-        The effect size to be converted for the appropriate effect type.
+    effect_size : float or np.ndarray
+        The effect size(s) to be converted for the appropriate effect type.
     baseline_mean : float
         Mean in the baseline group for the experiment - used as a proxy to estimate
         the mean in the experiment control group.
@@ -208,14 +270,14 @@ def convert_effect_size_for_normal_outcome(
 
     Returns
     -------
-    float
+    float or np.ndarray
         The effect size converted from Cohen's D to an absolute or relative effect. 
     """
     absolute_effect = effect_size * baseline_stdev
     if effect_type == "Absolute Effect":
-        return round(absolute_effect, 3)
+        return np.round(absolute_effect, 3)
     
-    return round(100 * (absolute_effect / baseline_mean), 2)
+    return np.round(100 * (absolute_effect / baseline_mean), 2)
 
 
 def normal_effect_size(
@@ -297,6 +359,134 @@ def effect_size(
 #===============================================#
 #-------------- Sample/MDE Calcs ---------------#
 #===============================================#
+def _ttest_ind_power(
+    effect_size:Union[float, np.ndarray],
+    nobs1:Union[float, np.ndarray],
+    alpha:float,
+    ratio:float,
+    alternative:AlternativeType="two-sided",
+) -> np.ndarray:
+    """
+    Calculates the power of a two sample t-test elementwise over array inputs.
+    This mirrors statsmodels' TTestIndPower.power so the power curve solvers
+    agree with tt_ind_solve_power.
+
+    Parameters
+    ----------
+    effect_size : float or np.ndarray
+        The standardised effect size (Cohen's D).
+    nobs1 : float or np.ndarray
+        The sample size for group 1.
+    alpha : float
+        Alpha (significance) value used for the confidence interval calculation.
+    ratio : float
+        The required group1:group2 sample size ratio.
+    alternative : str in ['two-sided', 'smaller', 'larger']
+        The alternative hypothesis specifying either a two-sided or the type of
+        one-sided test.
+
+    Returns
+    -------
+    np.ndarray
+        Power of the test for each effect size and sample size.
+    """
+    nobs2 = nobs1 * ratio
+    dof = nobs1 + nobs2 - 2
+    non_centrality = effect_size * np.sqrt(1.0 / (1.0 / nobs1 + 1.0 / nobs2))
+    tail_alpha = alpha / 2.0 if alternative == "two-sided" else alpha
+
+    power = 0.0
+    if alternative in ("two-sided", "larger"):
+        power = power + 1.0 - special.nctdtr(dof, non_centrality, stats.t.isf(tail_alpha, dof))
+    if alternative in ("two-sided", "smaller"):
+        # the lower tail underflows to nan for large effects, where it is negligible
+        power = power + np.nan_to_num(special.nctdtr(dof, non_centrality, stats.t.ppf(tail_alpha, dof)))
+    return power
+
+def _solve_power_curve(
+    power_function,
+    seed:np.ndarray,
+    power:np.ndarray,
+    lower_bound:float,
+) -> np.ndarray:
+    """
+    Finds the root of the power function for every target power in a single
+    vectorised bracketing search.
+
+    Parameters
+    ----------
+    power_function : callable
+        Function of the unknown value returning the power of the test.
+    seed : np.ndarray
+        Initial estimates of the unknown value for each target power.
+    power : np.ndarray
+        The target power values.
+    lower_bound : float
+        The smallest valid value for the unknown.
+
+    Returns
+    -------
+    np.ndarray
+        The solution for each target power, or nan where no solution exists.
+    """
+    def power_identity(x, target_power):
+        return power_function(x) - target_power
+
+    bracket = elementwise.bracket_root(
+        power_identity, np.maximum(seed, lower_bound), xmin=lower_bound, args=(power,)
+    )
+    root = elementwise.find_root(power_identity, bracket.bracket, args=(power,))
+    return np.where(bracket.success & root.success, root.x, np.nan)
+
+def _round_key(value:Union[float, None]) -> Union[float, None]:
+    """Round a solver input so that near-identical floats share a cache entry."""
+    return None if value is None else round(float(value), 10)
+
+def _solve(
+    effect_size:Union[float, None],
+    nobs1:Union[float, None],
+    alpha:float,
+    power:float,
+    ratio:float,
+    alternative:AlternativeType,
+) -> float:
+    """
+    Solve for whichever of effect_size or nobs1 is None with tt_ind_solve_power,
+    memoising the result on the rounded inputs.
+    """
+    return _solve_cached(
+        _round_key(effect_size),
+        _round_key(nobs1),
+        _round_key(alpha),
+        _round_key(power),
+        _round_key(ratio),
+        alternative,
+    )
+
+@lru_cache(maxsize=4096)
+def _solve_cached(
+    effect_size_r:Union[float, None],
+    nobs1_r:Union[float, None],
+    alpha_r:float,
+    power_r:float,
+    ratio_r:float,
+    alternative:AlternativeType,
+) -> float:
+    # statsmodels is slow to import and only needed when a root has to be found, 
+    # so it is imported on first use rather than with this module
+    from statsmodels.stats.power import tt_ind_solve_power
+
+    result = tt_ind_solve_power(
+        effect_size = effect_size_r,
+        nobs1 = nobs1_r,
+        alpha = alpha_r,
+        power = power_r,
+        ratio = ratio_r,
+        alternative = alternative
+    )
+    # statsmodels occasionally returns a 1-element array rather than a scalar
+    return float(np.squeeze(result))
+
 def n1_sample_size(
     effect_size:float,
     alpha:float,
@@ -329,17 +519,47 @@ def n1_sample_size(
         experiment with the specified minimum detectable effect. 
     """
 
-    return ceil(
-        tt_ind_solve_power(
-            effect_size = effect_size,
-            nobs1 = None,
-            alpha = alpha,
-            power = power,
-            ratio = ratio,
-            alternative = alternative
-        )
+    return _n1_sample_size_cached(
+        _round_key(effect_size),
+        _round_key(alpha),
+        _round_key(power),
+        _round_key(ratio),
+        alternative,
     )
 
+# number of consecutive sample sizes checked above the normal approximation
+_N1_SEARCH_WIDTH = 64
+
+@lru_cache(maxsize=4096)
+def _n1_sample_size_cached(
+    effect_size_r:float,
+    alpha_r:float,
+    power_r:float,
+    ratio_r:float,
+    alternative:AlternativeType,
+) -> int:
+    """
+    Smallest group 1 sample size reaching the target power, memoised on the 
+    rounded inputs.
+    """
+    tail_alpha = alpha_r / 2 if alternative == "two-sided" else alpha_r
+    z_total = _z_two_sided(2 * tail_alpha) + special.ndtri(power_r)
+    seed = (z_total / effect_size_r)**2 * (1 + 1 / ratio_r) if effect_size_r else np.inf
+
+    # the normal approximation sits just below the t-test solution, so the answer
+    # is the first of a short run of sample sizes above it that reaches the power
+    if isfinite(seed):
+        candidates = max(ceil(seed) - 2, 2) + np.arange(_N1_SEARCH_WIDTH, dtype=np.float64)
+        reaches_power = _ttest_ind_power(effect_size_r, candidates, alpha_r, ratio_r, alternative) >= power_r
+        first = int(np.argmax(reaches_power))
+        # a hit on the first candidate only counts if no smaller sample size is possible
+        if reaches_power[first] and (first > 0 or candidates[0] == 2):
+            return int(candidates[first])
+
+    # otherwise (e.g. low powers, where the second tail of a two-sided test matters) 
+    # fall back to root finding
+    return ceil(_solve_cached(effect_size_r, None, alpha_r, power_r, ratio_r, alternative))
+
 def sample_size_list(
     effect_size:float,
     power_range:Union[list, np.ndarray],
@@ -373,9 +593,23 @@ def sample_size_list(
     List
         Sample sizes required for an experiment for each power in the provided power range.
     """
-    nobs1 = np.array([n1_sample_size(effect_size=effect_size, alpha=alpha, power=p, ratio=limiting_ratio, alternative=alternative) for p in power_range])
-    total_obs = nobs1 * sum(flight_ratios)
-    return list(np.ceil(total_obs))
+    power = np.asarray(power_range, dtype=np.float64)
+    tail_alpha = alpha / 2 if alternative == "two-sided" else alpha
+
+    # normal approximation to seed the search for the t-test solution
+    z_total = _z_two_sided(2 * tail_alpha) + special.ndtri(power)
+    seed = (z_total / effect_size)**2 * (1 + 1 / limiting_ratio)
+
+    nobs1 = _solve_power_curve(
+        lambda n: _ttest_ind_power(effect_size, n, alpha, limiting_ratio, alternative),
+        seed=seed,
+        power=power,
+        lower_bound=2.0,
+    )
+    # whole group 1 sample sizes, then whole samples in every group, exactly as the
+    # power page builds its total so the curve agrees with the reported requirement
+    flight_ratios = np.asarray(flight_ratios, dtype=np.float64)
+    return np.ceil(np.ceil(nobs1)[:, np.newaxis] * flight_ratios).sum(axis=1).tolist()
 
 def minimum_detectable_effect_size(
     nobs1:int,
@@ -407,13 +641,7 @@ def minimum_detectable_effect_size(
     float
         Minimum detectable effect.
     """
-    return tt_ind_solve_power(
-            nobs1 = nobs1,
-            alpha = alpha,
-            power = power,
-            ratio = ratio,
-            alternative = alternative
-    )
+    return _solve(None, nobs1, alpha, power, ratio, alternative)
 
 def effect_size_list(
     nobs1:float,
@@ -457,13 +685,31 @@ def effect_size_list(
         List of effect size values to be used in the x-axis of the power-curve.
     """
     assert outcome_type in ("binary", "normal")
-    effect_sizes = np.array([minimum_detectable_effect_size(nobs1=nobs1, alpha=alpha, power=p, ratio=limiting_ratio, alternative=alternative) for p in list(power_range)])
+    power = np.asarray(power_range, dtype=np.float64)
+    tail_alpha = alpha / 2 if alternative == "two-sided" else alpha
+
+    # normal approximation to seed the search for the t-test solution
+    z_total = _z_two_sided(2 * tail_alpha) + special.ndtri(power)
+    seed = z_total * sqrt(1 / nobs1 + 1 / (nobs1 * limiting_ratio))
+
+    # the search runs over positive effects, and the 'smaller' alternative is the 
+    # mirror image of 'larger' for negative effects
+    search_alternative = "larger" if alternative == "smaller" else alternative
+    effect_sizes = _solve_power_curve(
+        lambda es: _ttest_ind_power(es, nobs1, alpha, limiting_ratio, search_alternative),
+        seed=seed,
+        power=power,
+        lower_bound=0.0,
+    )
+    if alternative == "smaller":
+        effect_sizes = -effect_sizes
+    # a target power equal to alpha is met by no effect at all, which sits on the 
+    # lower edge of the search
+    effect_sizes = np.where(np.isclose(power, alpha, rtol=1e-12, atol=0.0), 0.0, effect_sizes)
     if outcome_type == "binary":
-        vectorised_conversion = np.vectorize(convert_effect_size_for_binary_outcome)
-        return list(vectorised_conversion(effect_type, effect_sizes, baseline_mean))
+        return list(convert_effect_size_for_binary_outcome(effect_type, effect_sizes, baseline_mean))
 
-    vectorised_conversion = np.vectorize(convert_effect_size_for_normal_outcome)
-    return list(vectorised_conversion(effect_type, effect_sizes, baseline_mean, baseline_stdev))
+    return list(convert_effect_size_for_normal_outcome(effect_type, effect_sizes, baseline_mean, baseline_stdev))
 
 def plot_x_data(
     calculation_type:CalculationType,
@@ -561,16 +807,18 @@ def design_ratio(ratios:Union[list, np.ndarray, pd.Series]) -> float:
     float
         The ratio to be used for the sample size or minimum detectable effect calculation.
     """
-    if (biggest_ratio:=max(ratios)) >= 1 / (smallest_ratio:=min(ratios)):
-            return biggest_ratio
+    ratios = np.asarray(ratios, dtype=np.float64)
+    biggest_ratio, smallest_ratio = float(ratios.max()), float(ratios.min())
+    if biggest_ratio >= 1 / smallest_ratio:
+        return biggest_ratio
     return smallest_ratio
 
 def get_comparison_pairs(
     comparison_type:ComparisonType, 
     num_flights:int,
-) -> List[Tuple[int, int]]:
+) -> np.ndarray:
     """
-    Generate a lits of row pairs to compare for group comparison results.
+    Generate an array of row pairs to compare for group comparison results.
 
     Parameters
     ----------
@@ -582,13 +830,26 @@ def get_comparison_pairs(
 
     Returns
     -------
-    List[Tuple[int, int]]
-        List of tuples containg the comparison pairs as they would appear as
-        rows in a dataframe.
+    np.ndarray
+        Integer array of shape (num_comparisons, 2) containing the comparison
+        pairs as they would appear as rows in a dataframe. The array is shared
+        between calls with the same arguments, so it is read-only.
+    """
+    return _comparison_pairs_cached(comparison_type, int(num_flights))
+
+@lru_cache(maxsize=64)
+def _comparison_pairs_cached(comparison_type:ComparisonType, num_flights:int) -> np.ndarray:
+    """
+    Comparison pairs for get_comparison_pairs, memoised on the two (hashable) arguments.
     """
     if comparison_type == "Compare to first":
-        return [(0, i) for i in range(1, num_flights)]
-    return list(combinations(range(num_flights), 2))
+        other_flights = np.arange(1, max(num_flights, 1), dtype=np.intp)
+        pairs = np.column_stack((np.zeros_like(other_flights), other_flights))
+    else:
+        pairs = np.column_stack(np.triu_indices(num_flights, k=1)).astype(np.intp, copy=False)
+
+    pairs.setflags(write=False)
+    return pairs
 
 
 #===============================================#
@@ -621,27 +882,32 @@ def group_responses(
         group in the experiment.
     """
 
+    sample_sizes = experiment_data_summary["Sample Size"].to_numpy(dtype=np.float64)
+
     if outcome_type == "binary":
-        confint = proportion.proportion_confint(
-            count = experiment_data_summary["Num Successes"],
-            nobs = experiment_data_summary["Sample Size"],
-            alpha = alpha,
-            method = "normal"
+        num_successes = experiment_data_summary["Num Successes"].to_numpy(dtype=np.float64)
+        point_estimate = num_successes / sample_sizes
+        # normal approximation (Wald) interval, clipped to [0, 1] as in
+        # statsmodels' proportion_confint(method="normal")
+        margin_of_error = _z_two_sided(alpha) * np.sqrt(
+            point_estimate * (1 - point_estimate) / sample_sizes
         )
-        confint_df = pd.DataFrame(confint).T
-        confint_df.columns = ["ci_lower", "ci_upper"]
-        confint_df["point_estimate"] = experiment_data_summary["Num Successes"] / experiment_data_summary["Sample Size"]
+        ci_lower = np.clip(point_estimate - margin_of_error, 0, 1)
+        ci_upper = np.clip(point_estimate + margin_of_error, 0, 1)
     
     else:
-        standard_error = experiment_data_summary["StdDev"] / np.sqrt(experiment_data_summary["Sample Size"])
-        confidence = 1 - alpha
-        confint = stats.norm.interval(confidence, loc=experiment_data_summary["Mean"], scale=standard_error)
-        confint_df = pd.DataFrame(confint).T
-        confint_df.columns = ["ci_lower", "ci_upper"]
-        confint_df["point_estimate"] = experiment_data_summary["Mean"]
-
-    confint_df["group_name"] = experiment_data_summary["Group Name"]
-    return confint_df[["group_name", "point_estimate", "ci_lower", "ci_upper"]]
+        point_estimate = experiment_data_summary["Mean"].to_numpy(dtype=np.float64)
+        standard_error = experiment_data_summary["StdDev"].to_numpy(dtype=np.float64) / np.sqrt(sample_sizes)
+        margin_of_error = _z_two_sided(alpha) * standard_error
+        ci_lower = point_estimate - margin_of_error
+        ci_upper = point_estimate + margin_of_error
+
+    return pd.DataFrame({
+        "group_name": experiment_data_summary["Group Name"].to_numpy(),
+        "point_estimate": point_estimate,
+        "ci_lower": ci_lower,
+        "ci_upper": ci_upper,
+    })
 
 def binomial_standard_error(
     proportion:float, 
@@ -662,13 +928,69 @@ def binomial_standard_error(
     float
         Standard error for the given proportion and sample size.
     """
-    return np.sqrt(proportion * (1 - proportion) / sample_size)
+    return sqrt(proportion * (1 - proportion) / sample_size)
+
+def _binomial_difference_interval(
+    prop1:Union[float, np.ndarray],
+    n1:Union[int, np.ndarray],
+    prop2:Union[float, np.ndarray],
+    n2:Union[int, np.ndarray],
+    z_crit:float,
+    effect_type:EffectType,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the point estimates and confidence intervals for the differences
+    between groups with binomially distributed outcomes, elementwise over arrays
+    of comparison pairs.
+
+    Parameters
+    ----------
+    prop1 : float or np.ndarray
+        Response rate (proportion) for group 1 of each pair.
+    n1 : int or np.ndarray
+        Sample size for group 1 of each pair.
+    prop2 : float or np.ndarray
+        Response rate (proportion) for group 2 of each pair.
+    n2 : int or np.ndarray
+        Sample size for group 2 of each pair.
+    z_crit : float
+        Critical z-value for the desired confidence level.
+    effect_type : str
+        String of either 'Absolute Effect' or 'Relative Effect' indicating
+        the type of minimum detectable effect being measured  in the experiment.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The point estimates, lower confidence bounds and upper confidence bounds.
+    """
+
+    # Difference in proportions
+    prop_diff = prop2 - prop1
+    
+    # Work with the variances directly rather than squaring standard errors
+    variance_1 = prop1 * (1 - prop1) / n1
+    variance_2 = prop2 * (1 - prop2) / n2
+
+    if effect_type == "Relative Effect":
+        inv_prop1_sq = 1.0 / (prop1 * prop1)
+        prop_diff = prop_diff / prop1
+        # Use the delta method to estimate the standard error for the relative effect
+        se_diff = np.sqrt(inv_prop1_sq * (variance_2 + prop2 * prop2 * inv_prop1_sq * variance_1))
+    else:
+        # Standard error of the difference
+        se_diff = np.sqrt(variance_1 + variance_2)
+    
+    # Confidence interval
+    margin_of_error = z_crit * se_diff
+
+    return prop_diff, prop_diff - margin_of_error, prop_diff + margin_of_error
 
 def binomial_confidence_interval(
-    prop1:float, 
-    n1:int, 
-    prop2:float, 
-    n2:int, 
+    prop1:Union[float, np.ndarray], 
+    n1:Union[int, np.ndarray], 
+    prop2:Union[float, np.ndarray], 
+    n2:Union[int, np.ndarray], 
     confidence:float, 
     effect_type:EffectType
 ) -> ConfidenceIntervalResult:
@@ -678,13 +1000,13 @@ def binomial_confidence_interval(
 
     Parameters
     ----------
-    prop1 : float
+    prop1 : float or np.ndarray
         Response rate (proportion) for group 1.
-    n1 : int
+    n1 : int or np.ndarray
         Sample size for group 1.
-    prop2 : float
+    prop2 : float or np.ndarray
         Response rate (proportion) for group 2.
-    n2 : int
+    n2 : int or np.ndarray
         Sample size for group 1.
     confidence : float
         Confidence (1 - alpha) to be used in confidence interval calulaitons.
@@ -696,36 +1018,32 @@ def binomial_confidence_interval(
     -------
     Dict
         Dictionary containing the point estimate and confidence interval calculations 
-        for binomial confidence intervals.
+        for binomial confidence intervals. Array inputs (one element per comparison 
+        pair) give arrays of results, scalar inputs give floats.
     """
+    # Critical z-value for the desired confidence level, shared by every pair
+    z_crit = _z_two_sided(1 - confidence)
+
+    prop_diff, ci_lower, ci_upper = _binomial_difference_interval(
+        np.asarray(prop1, dtype=np.float64), 
+        np.asarray(n1, dtype=np.float64), 
+        np.asarray(prop2, dtype=np.float64), 
+        np.asarray(n2, dtype=np.float64), 
+        z_crit, 
+        effect_type,
+    )
 
-    # Difference in proportions
-    prop_diff = prop2 - prop1
-    
-    std_err_1 = binomial_standard_error(proportion=prop1, sample_size=n1)
-    std_err_2 = binomial_standard_error(proportion=prop2, sample_size=n2)
-
-    if effect_type == "Relative Effect":
-        prop_diff = prop_diff / prop1
-        # Use the delta method to estimate the standard error for the relative effect
-        se_diff = np.sqrt(1/(prop1 ** 2) * (std_err_2 ** 2) + (prop2 ** 2) / (prop1 ** 4) * (std_err_1 ** 2))
-    else:
-        # Standard error of the difference
-        se_diff = np.sqrt(std_err_1**2 + std_err_2**2)
-    
-    # Critical z-value for the desired confidence level
-    z_crit = stats.norm.ppf((1 + confidence) / 2)
-    
-    # Confidence interval
-    margin_of_error = z_crit * se_diff
-
-    ci_lower = prop_diff - margin_of_error
-    ci_upper = prop_diff + margin_of_error
+    if np.ndim(prop_diff) > 0:
+        return {
+            "point_estimate": prop_diff, 
+            "ci_lower": ci_lower, 
+            "ci_upper": ci_upper,
+        }
     
     return {
-        "point_estimate": [prop_diff], 
-        "ci_lower": [ci_lower], 
-        "ci_upper": [ci_upper],
+        "point_estimate": float(prop_diff), 
+        "ci_lower": float(ci_lower), 
+        "ci_upper": float(ci_upper),
     }
 
 def normal_standard_error(
@@ -748,7 +1066,7 @@ def normal_standard_error(
     float
         Standard error for the given standard deviation and sample size.
     """
-    return stdev / np.sqrt(sample_size)
+    return stdev / sqrt(sample_size)
 
 def dof_welch_satterthwaithe(
     stdev1:float, 
@@ -777,10 +1095,75 @@ def dof_welch_satterthwaithe(
     int
         Degrees of freedom for t-test calculations.
     """
-    numerator = ((stdev1**2 / n1) + (stdev2**2 / n2))**2
-    denominator = (((stdev1**2 / n1)**2 / (n1 - 1)) + ((stdev2**2 / n2)**2 / (n2 - 1)))
+    # variance of each group mean, calculated once and reused in both terms
+    variance_1 = stdev1 * stdev1 / n1
+    variance_2 = stdev2 * stdev2 / n2
+
+    numerator = (variance_1 + variance_2) * (variance_1 + variance_2)
+    denominator = variance_1 * variance_1 / (n1 - 1) + variance_2 * variance_2 / (n2 - 1)
     return numerator / denominator
 
+def _normal_difference_interval(
+    mean1:Union[float, np.ndarray],
+    stdev1:Union[float, np.ndarray],
+    n1:Union[int, np.ndarray],
+    mean2:Union[float, np.ndarray],
+    stdev2:Union[float, np.ndarray],
+    n2:Union[int, np.ndarray],
+    t_crit:Union[float, np.ndarray],
+    effect_type:EffectType,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the point estimates and confidence intervals for the differences
+    between groups with normally distributed outcomes, elementwise over arrays
+    of comparison pairs.
+
+    Parameters
+    ----------
+    mean1 : float or np.ndarray
+        Mean response for group 1 of each pair.
+    stdev1 : float or np.ndarray
+        Standard deviation for group 1 of each pair.
+    n1 : int or np.ndarray
+        Sample size for group 1 of each pair.
+    mean2 : float or np.ndarray
+        Mean response for group 2 of each pair.
+    stdev2 : float or np.ndarray
+        Standard deviation for group 2 of each pair.
+    n2 : int or np.ndarray
+        Sample size for group 2 of each pair.
+    t_crit : float or np.ndarray
+        Critical t-value(s) for the desired confidence level.
+    effect_type : str
+        String of either 'Absolute Effect' or 'Relative Effect' indicating
+        the type of minimum detectable effect being measured  in the experiment.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The point estimates, lower confidence bounds and upper confidence bounds.
+    """
+
+    # Difference of means
+    mean_diff = mean2 - mean1
+
+    # Work with the variances directly rather than squaring standard errors
+    variance_1 = stdev1 * stdev1 / n1
+    variance_2 = stdev2 * stdev2 / n2
+
+    if effect_type == "Relative Effect":
+        inv_mean1_sq = 1.0 / (mean1 * mean1)
+        mean_diff = mean_diff / mean1
+        # Use the delta method to estimate the standard error for the relative effect
+        std_err_diff = np.sqrt(inv_mean1_sq * (variance_2 + mean2 * mean2 * inv_mean1_sq * variance_1))
+    else:
+        std_err_diff = np.sqrt(variance_1 + variance_2)
+    
+    # confidence interval
+    margin_of_error = t_crit * std_err_diff
+
+    return mean_diff, mean_diff - margin_of_error, mean_diff + margin_of_error
+
 def normal_confidence_interval(
     mean1:float, 
     stdev1:float, 
@@ -821,42 +1204,28 @@ def normal_confidence_interval(
         Dictionary containing the point estimate and confidence interval calculations 
         for between group differences.
     """
-
-    # Difference of means
-    mean_diff = mean2 - mean1
-
-    std_err_1 = stdev1 / np.sqrt(n1)
-    std_err_2 = stdev2 / np.sqrt(n2)
-
-    if effect_type == "Relative Effect":
-        mean_diff = mean_diff / mean1 
-        # Use the delta method to estimate the standard error for the relative effect
-        std_err_diff = np.sqrt(1/(mean1 ** 2) * (std_err_2 ** 2) + (mean2 ** 2) / (mean1 ** 4) * (std_err_1 ** 2))
-    else:
-        std_err_diff = np.sqrt(std_err_1**2 + std_err_2**2)
-    
     # Degrees of freedom using the Welch–Satterthwaite equation
     # which calcuates the dof where samples may have unequal variances.
     dof = dof_welch_satterthwaithe(stdev1, n1, stdev2, n2)
 
-    # t critical value for the confidence level
-    t_crit = stats.t.ppf((1 + confidence) / 2, dof)
-    
-    # confidence interval
-    margin_of_error = t_crit * std_err_diff
-    ci_lower = mean_diff - margin_of_error
-    ci_upper = mean_diff + margin_of_error
+    # t critical value for the confidence level; stdtrit is the t quantile
+    # ufunc behind stats.t.ppf
+    t_crit = special.stdtrit(dof, (1 + confidence) / 2)
+
+    mean_diff, ci_lower, ci_upper = _normal_difference_interval(
+        mean1, stdev1, n1, mean2, stdev2, n2, t_crit, effect_type
+    )
     
     return {
-        "point_estimate": [mean_diff], 
-        "ci_lower": [ci_lower], 
-        "ci_upper": [ci_upper],
+        "point_estimate": float(mean_diff), 
+        "ci_lower": float(ci_lower), 
+        "ci_upper": float(ci_upper),
     }
 
 def group_differences(
     experiment_data_summary:pd.DataFrame,
     alpha:float,
-    comparison_pairs:List[Tuple[int, int]],
+    comparison_pairs:Union[np.ndarray, List[Tuple[int, int]]],
     outcome_type:OutcomeType,
     effect_type:EffectType,
 ) -> pd.DataFrame:
@@ -867,9 +1236,10 @@ def group_differences(
         Dataframe containing summary statistics for each group in the experiment.
     alpha : float
         alpha (significance) value used for the confidence interval calculation.
-    comparison_pairs : List[Tuple[int, int]]
-        List of row number comparison pairs, to identify which groups from the 
-        experiment_data_summary are to be used for group difference calculations.
+    comparison_pairs : np.ndarray or List[Tuple[int, int]]
+        Row number comparison pairs (as returned by get_comparison_pairs), to identify
+        which groups from the experiment_data_summary are to be used for group
+        difference calculations.
     outcome_type : str
         String of either 'binary or 'normal' indicating the distribution
         of the outcome being measured. 
@@ -883,50 +1253,57 @@ def group_differences(
         Dataframe containing calculations for group difference comparisons. 
     """
 
-    group_differences = pd.DataFrame()
-    for group1, group2 in comparison_pairs:
-        group1 = experiment_data_summary.iloc[group1]
-        group1_name = group1['Group Name']
-
-        group2 = experiment_data_summary.iloc[group2]
-        group2_name = group2['Group Name']
-
-        comparison_name = f"{group2_name} - {group1_name}"
-
-        if outcome_type == "binary":
-            diff_summary = binomial_confidence_interval(
-                prop1=group1["Num Successes"] / group1["Sample Size"],
-                n1=group1["Sample Size"],
-                prop2=group2["Num Successes"] / group2["Sample Size"],
-                n2=group2["Sample Size"],
-                confidence=1.0-alpha,
-                effect_type=effect_type,
-            )
-
-        else:
-            diff_summary = normal_confidence_interval(
-                mean1=group1["Mean"], 
-                stdev1=group1["StdDev"], 
-                n1=group1["Sample Size"], 
-                mean2=group2["Mean"], 
-                stdev2=group2["StdDev"], 
-                n2=group2["Sample Size"], 
-                confidence=1.0-alpha, 
-                effect_type=effect_type,
-            )
-        
-        group_difference = pd.DataFrame({
-            "group_name": comparison_name, 
-            "group1_name": group1_name,
-            "group2_name": group2_name,
-            **diff_summary
-        })
-
-        if group_differences.empty:
-            group_differences = group_difference
-        else:
-            group_differences = pd.concat([group_differences, group_difference])
-    return group_differences
+    comparison_pairs = np.asarray(comparison_pairs, dtype=np.intp).reshape(-1, 2)
+    group1_rows = comparison_pairs[:, 0]
+    group2_rows = comparison_pairs[:, 1]
+
+    group_names = experiment_data_summary["Group Name"].to_numpy()
+    group1_names = group_names[group1_rows]
+    group2_names = group_names[group2_rows]
+
+    sample_sizes = experiment_data_summary["Sample Size"].to_numpy(dtype=np.float64)
+    n1 = sample_sizes[group1_rows]
+    n2 = sample_sizes[group2_rows]
+
+    # the critical values only depend on alpha (and the dof), so are computed once for all pairs
+    critical_probability = 1.0 - alpha / 2
+
+    if outcome_type == "binary":
+        proportions = experiment_data_summary["Num Successes"].to_numpy(dtype=np.float64) / sample_sizes
+        point_estimate, ci_lower, ci_upper = _binomial_difference_interval(
+            prop1=proportions[group1_rows],
+            n1=n1,
+            prop2=proportions[group2_rows],
+            n2=n2,
+            z_crit=_z_two_sided(alpha),
+            effect_type=effect_type,
+        )
+
+    else:
+        means = experiment_data_summary["Mean"].to_numpy(dtype=np.float64)
+        stdevs = experiment_data_summary["StdDev"].to_numpy(dtype=np.float64)
+        stdev1 = stdevs[group1_rows]
+        stdev2 = stdevs[group2_rows]
+        dof = dof_welch_satterthwaithe(stdev1, n1, stdev2, n2)
+        point_estimate, ci_lower, ci_upper = _normal_difference_interval(
+            mean1=means[group1_rows], 
+            stdev1=stdev1, 
+            n1=n1, 
+            mean2=means[group2_rows], 
+            stdev2=stdev2, 
+            n2=n2, 
+            t_crit=special.stdtrit(dof, critical_probability), 
+            effect_type=effect_type,
+        )
+
+    return pd.DataFrame({
+        "group_name": [f"{group2_name} - {group1_name}" for group1_name, group2_name in zip(group1_names, group2_names)],
+        "group1_name": group1_names,
+        "group2_name": group2_names,
+        "point_estimate": point_estimate,
+        "ci_lower": ci_lower,
+        "ci_upper": ci_upper,
+    })
 
 def format_outcomes_for_plots(
     experiment_results:pd.DataFrame, 
@@ -961,9 +1338,11 @@ def format_outcomes_for_plots(
         decimal_places = 4
         multiplier = 1
 
-    experiment_results["point_estimate"] = round(experiment_results["point_estimate"] * multiplier, decimal_places)
-    experiment_results["ci_lower"] = round(experiment_results["ci_lower"] * multiplier, decimal_places)
-    experiment_results["ci_upper"] = round(experiment_results["ci_upper"] * multiplier, decimal_places)
+    outcome_columns = ["point_estimate", "ci_lower", "ci_upper"]
+    values = experiment_results[outcome_columns].to_numpy(dtype=np.float64)
+    np.multiply(values, multiplier, out=values)
+    np.round(values, decimal_places, out=values)
+    experiment_results[outcome_columns] = values
 
     return experiment_results
 
@@ -987,12 +1366,34 @@ def srm_pvalue(sample_size_data:pd.DataFrame) -> float:
         provided sample sizes match their expected proportions.
     """
 
-    total_samples = sample_size_data["Sample Size"].sum()
+    sample_sizes = sample_size_data["Sample Size"].to_numpy(np.float64)
+
+    return _srm_pvalue_cached(
+        counts = tuple(sample_sizes.tolist()),
+        total = sample_sizes.sum().item(),
+        expected = tuple(sample_size_data["Expected Proportion"].to_numpy(np.float64).tolist()),
+    )
+
+@lru_cache(maxsize=256)
+def _srm_pvalue_cached(counts:Tuple[float, ...], total:float, expected:Tuple[float, ...]) -> float:
+    """
+    Chi-square p-value for srm_pvalue, memoised on the (hashable) input table.
+
+    This is the same test as statsmodels' proportions_chisquare (each group's 
+    count tested against total * expected proportion, with one degree of 
+    freedom per group), evaluated directly rather than through scipy's 
+    chisquare dispatch.
+    """
+    counts = np.asarray(counts)
+    expected = np.asarray(expected)
+
+    # the in-group and out-of-group cells share the same squared deviation
+    expected_counts = total * expected
+    chi2_stat = np.sum((counts - expected_counts)**2 / (expected_counts * (1 - expected)))
 
-    p_value = proportion.proportions_chisquare(
-        count = sample_size_data["Sample Size"], 
-        nobs = total_samples, 
-        value = sample_size_data["Expected Proportion"] 
-    )[1]
+    # the usual two group split has two degrees of freedom, where the chi-square 
+    # survival function is exactly exp(-x / 2)
+    if counts.size == 2:
+        return exp(-0.5 * chi2_stat)
 
-    return p_value
\ No newline at end of file
+    return float(special.chdtrc(counts.size, chi2_stat))
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Literal, TypedDict
+from typing import Literal, TypedDict, Union
+import numpy as np
 
 OutcomeType = Literal["binary", "normal"]
 EffectType = Literal["Absolute Effect", "Relative Effect"]
@@ -9,7 +10,7 @@ SequentialType = Literal["O'Brien-Fleming", "None"]
 AlternativeType = Literal["two-sided", "smaller", "larger"]
 
 class ConfidenceIntervalResult(TypedDict):
-    """Result from confidence interval calculations."""
-    point_estimate: list[float]
-    ci_lower: list[float]
-    ci_upper: list[float]
\ No newline at end of file
+    """Result from confidence interval calculations (arrays when given arrays of pairs)."""
+    point_estimate: Union[float, np.ndarray]
+    ci_lower: Union[float, np.ndarray]
+    ci_upper: Union[float, np.ndarray]
\ No newline at end of file
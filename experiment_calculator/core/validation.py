@@ -1,39 +1,39 @@
+import numpy as np
 import pandas as pd
 from experiment_calculator.core.types import OutcomeType
 
+def _column_values(data:pd.DataFrame, column:str) -> np.ndarray:
+    # missing cells are skipped, matching pandas' default reductions
+    values = data[column].to_numpy(dtype=np.float64)
+    return values[~np.isnan(values)]
+
 def valid_traffic_allocation(traffic_allocation:pd.DataFrame) -> bool:
-    
-    min_allocation = traffic_allocation["Traffic Allocation (%)"].min()
-    max_allocation = traffic_allocation["Traffic Allocation (%)"].max()
-    total_traffic = traffic_allocation["Traffic Allocation (%)"].sum()
 
-    return min_allocation > 0 and max_allocation < 100 and total_traffic <= 100
+    allocations = _column_values(traffic_allocation, "Traffic Allocation (%)")
+    if allocations.size == 0 or allocations.min() <= 0:
+        return False
 
-def valid_summary_data(summary_data:pd.DataFrame, outcome_type:OutcomeType) -> bool:
+    return bool(allocations.max() < 100 and allocations.sum() <= 100)
 
-    valid_samples = summary_data["Sample Size"] > 0
-    all_samples_valid = valid_samples.all()
+def valid_summary_data(summary_data:pd.DataFrame, outcome_type:OutcomeType) -> bool:
 
     if outcome_type == "binary":
-        valid_successes = summary_data["Num Successes"] >= 0
-        all_successes_valid = valid_successes.all()
-
-        return all_samples_valid and all_successes_valid
+        columns = ["Sample Size", "Num Successes"]
+    else:
+        columns = ["Sample Size", "Mean", "StdDev"]
 
-    valid_means = summary_data["Mean"] >= 0
-    all_means_valid = valid_means.all()
-
-    valid_stdevs = summary_data["StdDev"] >= 0
-    all_stdevs_valid = valid_stdevs.all()
-
-    return all_samples_valid and all_means_valid and all_stdevs_valid
+    # one extraction for all the checked columns: sample sizes must be positive,
+    # and the remaining statistics non-negative
+    values = summary_data[columns].to_numpy(dtype=np.float64)
+    return bool((values[:, 0] > 0).all() and (values[:, 1:] >= 0).all())
 
 def valid_srm_data(summary_data:pd.DataFrame) -> bool:
-    
-    valid_samples = summary_data["Sample Size"] > 0
-    all_samples_valid = valid_samples.all()
 
-    min_expected_proportion = summary_data["Expected Proportion (%)"].min()
-    max_expected_proportion = summary_data["Expected Proportion (%)"].max()
+    if not (summary_data["Sample Size"].to_numpy() > 0).all():
+        return False
+
+    expected_proportions = _column_values(summary_data, "Expected Proportion (%)")
+    if expected_proportions.size == 0:
+        return False
 
-    return all_samples_valid and min_expected_proportion > 0 and max_expected_proportion < 100
+    return bool(expected_proportions.min() > 0 and expected_proportions.max() < 100)
@@ -4,8 +4,19 @@ import numpy as np
 from experiment_calculator.core import calculations, validation
 from experiment_calculator.ui import plots
 from experiment_calculator.ui import components
+from experiment_calculator.ui import caching
 from experiment_calculator.core.types import OutcomeType
 
+# the power curve is the expensive part of the page, so reruns triggered by
+# unrelated widgets reuse it
+_cached_plot_x_data = caching.cache_calculation(calculations.plot_x_data)
+_cached_power_curve = caching.cache_calculation(plots.power_curve)
+
+# Power range from 10% to 99% used for the power curve plot
+_POWER_RANGE = np.linspace(0.1, 0.99, 90)
+_POWER_RANGE.setflags(write=False)
+_POWER_PERCENTS = (_POWER_RANGE * 100).tolist()
+
 def show_power(outcome_type:OutcomeType) -> None:
 
     st.header(f"Power Calculator - {outcome_type.title()} Outcome")
@@ -73,19 +84,22 @@ def show_power(outcome_type:OutcomeType) -> None:
     with column_2:
 
         if traffic_allocation_is_valid:
+
+            traffic_allocation = sample_split["Traffic Allocation (%)"].to_numpy(dtype=np.float64)
+            traffic_allocation = traffic_allocation[~np.isnan(traffic_allocation)]
             
             # find the ratio that all other calculations will be dependent on
             if comparison_type == "Compare to first":
-                calculation_ratios = sample_split["Traffic Allocation (%)"].dropna() / sample_split["Traffic Allocation (%)"][0]
+                calculation_ratios = traffic_allocation / traffic_allocation[0]
                 ratio = calculations.design_ratio(calculation_ratios)
             else:
-                largest_traffic_allocation = sample_split["Traffic Allocation (%)"].max()
-                smallest_traffic_allocation = sample_split["Traffic Allocation (%)"].min()
+                largest_traffic_allocation = traffic_allocation.max()
+                smallest_traffic_allocation = traffic_allocation.min()
 
                 # the limiting ratio for experiment calculations will be between the largest and smallest traffic allocations
                 ratio = smallest_traffic_allocation / (largest_traffic_allocation + smallest_traffic_allocation)
 
-                calculation_ratios = sample_split["Traffic Allocation (%)"].dropna() / largest_traffic_allocation
+                calculation_ratios = traffic_allocation / largest_traffic_allocation
 
             if calculation_type == "Minimum Sample Size":
                 mde_estimate = None
@@ -105,9 +119,10 @@ def show_power(outcome_type:OutcomeType) -> None:
                     ratio = ratio,
                 )
 
-                required_sample_df = sample_split.copy()
-                required_sample_df["Minimum Samples Required"] = np.ceil(calculation_ratios * group1_samples_required)
-                total_samples_required = int(required_sample_df["Minimum Samples Required"].sum())
+                required_sample_df = sample_split.dropna(subset=["Traffic Allocation (%)"]).copy()
+                minimum_samples_required = np.ceil(calculation_ratios * group1_samples_required)
+                required_sample_df["Minimum Samples Required"] = minimum_samples_required
+                total_samples_required = int(minimum_samples_required.sum())
 
                 st.write("##### Calculation Results")
 
@@ -130,7 +145,7 @@ def show_power(outcome_type:OutcomeType) -> None:
                 effect_size = None
                 total_samples_required = None
 
-                nobs1 = available_sample_size / sum(calculation_ratios)
+                nobs1 = available_sample_size / calculation_ratios.sum()
 
                 mde_estimate = calculations.minimum_detectable_effect_size(
                     nobs1=nobs1,
@@ -175,14 +190,10 @@ def show_power(outcome_type:OutcomeType) -> None:
 
             ## ---- Plot Calculation ---- ##
 
-            # Power range from 1% to 99%
-            power_range = np.linspace(0.1, 0.99, 90)
-            power_percents = list(power_range * 100)
-
             # Calculate x-axis for the power curve plot
-            plot_x_data = calculations.plot_x_data(
+            plot_x_data = _cached_plot_x_data(
                 calculation_type=calculation_type,
-                power_range=power_range,
+                power_range=_POWER_RANGE,
                 nobs1=nobs1,
                 effect_size=effect_size,
                 alpha=alpha,
@@ -195,10 +206,10 @@ def show_power(outcome_type:OutcomeType) -> None:
                 alternative='two-sided',
             )
 
-            fig = plots.power_curve(
+            fig = _cached_power_curve(
                 calculation_type=calculation_type,
                 x_data=plot_x_data,
-                power_percents=power_percents,
+                power_percents=_POWER_PERCENTS,
                 target_power_level=power_level,
                 outcome_type=outcome_type,
             )
@@ -208,7 +219,9 @@ def show_power(outcome_type:OutcomeType) -> None:
         
         # Handle cases where the traffic allocation is invalid
         else:
-            st.write("#### :red[Sample Split Error:]")
-            st.write(":red[Traffic allocation for each individual group must be between 1% and 100%.]")
-            st.write(":red[Total traffic allocation must be 100% or less.]")
-            st.write(":red[Please change the input to meet these specifications.]")
+            st.markdown(
+                "#### :red[Sample Split Error:]\n\n"
+                + ":red[Traffic allocation for each individual group must be between 1% and 100%.]\n\n"
+                + ":red[Total traffic allocation must be 100% or less.]\n\n"
+                + ":red[Please change the input to meet these specifications.]"
+            )
@@ -3,6 +3,13 @@ from experiment_calculator.core.types import OutcomeType
 from experiment_calculator.core import calculations, validation
 from experiment_calculator.ui import plots
 from experiment_calculator.ui import components
+from experiment_calculator.ui import caching
+
+# cached so that reruns triggered by other widgets reuse earlier results
+_cached_group_differences = caching.cache_calculation(calculations.group_differences)
+_cached_group_responses = caching.cache_calculation(calculations.group_responses)
+_cached_group_difference_forest = caching.cache_calculation(plots.group_difference_forest)
+_cached_group_response_forest = caching.cache_calculation(plots.group_response_forest)
 
 def show_significance(outcome_type:OutcomeType) -> None:
     st.header(f"Significance Calculator - {outcome_type.title()} Outcome")
@@ -24,15 +31,16 @@ def show_significance(outcome_type:OutcomeType) -> None:
         st.markdown("**Summary data for each experiment group**")
         st.write(components.input_table_instructions())
 
-        experiment_summary = components.experiment_data_summary(outcome_type)
-        summary_data_is_valid = validation.valid_summary_data(experiment_summary.dropna(), outcome_type)
+        # rows added but left incomplete in the data editor are ignored
+        experiment_summary = components.experiment_data_summary(outcome_type).dropna()
+        summary_data_is_valid = validation.valid_summary_data(experiment_summary, outcome_type)
 
         effect_type = components.effect_type_selection()
 
         significance_level = components.significance_level_selection()
 
         comparison_type = components.comparison_type_selection()
-        comparison_pairs = calculations.get_comparison_pairs(comparison_type=comparison_type, num_flights=experiment_summary.dropna().shape[0])
+        comparison_pairs = calculations.get_comparison_pairs(comparison_type=comparison_type, num_flights=experiment_summary.shape[0])
         num_comparisons = len(comparison_pairs)
         
         mtc_type = components.mtc_type_selection()
@@ -61,8 +69,8 @@ def show_significance(outcome_type:OutcomeType) -> None:
             st.write("##### Calculation Results")
 
             ## ---- Group Difference Calculations ---- ##
-            difference_results = calculations.group_differences(
-                experiment_data_summary=experiment_summary.dropna(),
+            difference_results = _cached_group_differences(
+                experiment_data_summary=experiment_summary,
                 alpha=alpha,
                 comparison_pairs=comparison_pairs,
                 outcome_type=outcome_type,
@@ -71,34 +79,38 @@ def show_significance(outcome_type:OutcomeType) -> None:
             
             difference_results = calculations.format_outcomes_for_plots(difference_results, outcome_type, effect_type)
             
-            for row_number in range(difference_results.shape[0]):
-                row = difference_results.iloc[row_number,:]
-                result = row["point_estimate"]
-                ci_level = min(round((1 - alpha) * 100, 2), 99.999)
-                ci_lower = row['ci_lower']
-                ci_upper = row['ci_upper']
-
-                result_type = " units"
-                if outcome_type == "binary" or effect_type == "Relative Effect":
-                    result_type = "%"
-                
-                significance = "<u>is significant</u>"
-                if ci_lower <= 0 <= ci_upper:
-                    significance = "is NOT significant"
-
-                formatted_effect_type = "relative "
-                if effect_type == "Absolute Effect":
-                    formatted_effect_type = "absolute "
+            ci_level = min(round((1 - alpha) * 100, 2), 99.999)
+
+            result_type = " units"
+            if outcome_type == "binary" or effect_type == "Relative Effect":
+                result_type = "%"
+
+            formatted_effect_type = "relative "
+            if effect_type == "Absolute Effect":
+                formatted_effect_type = "absolute "
+
+            # a difference is significant when its confidence interval excludes 0
+            is_significant = (
+                (difference_results["ci_lower"].to_numpy() > 0) 
+                | (difference_results["ci_upper"].to_numpy() < 0)
+            )
+            
+            for row, row_is_significant in zip(difference_results.itertuples(index=False), is_significant):
+                result = row.point_estimate
+                ci_lower = row.ci_lower
+                ci_upper = row.ci_upper
+
+                significance = "<u>is significant</u>" if row_is_significant else "is NOT significant"
 
                 st.write(
                     f"""
-                    The difference between {row["group1_name"]} and {row["group2_name"]} **{significance}**, with a mean {formatted_effect_type}difference of **{result}{result_type}**, and a {ci_level}% confidence interval of ({ci_lower}{result_type}, {ci_upper}{result_type})
+                    The difference between {row.group1_name} and {row.group2_name} **{significance}**, with a mean {formatted_effect_type}difference of **{result}{result_type}**, and a {ci_level}% confidence interval of ({ci_lower}{result_type}, {ci_upper}{result_type})
                     """,
                     unsafe_allow_html=True
                 )
 
             ## ---- Group Difference Plot Generation ---- ##
-            group_differences = plots.group_difference_forest(
+            group_differences = _cached_group_difference_forest(
                 data=difference_results,
                 outcome_type=outcome_type,
                 effect_type=effect_type,
@@ -107,15 +119,15 @@ def show_significance(outcome_type:OutcomeType) -> None:
             st.plotly_chart(group_differences, width="stretch")
 
             ## ---- Group Response Plot Generation ---- ##
-            group_responses = calculations.group_responses(
+            group_responses = _cached_group_responses(
                 outcome_type=outcome_type,
-                experiment_data_summary=experiment_summary.dropna(),
+                experiment_data_summary=experiment_summary,
                 alpha=alpha
             )
 
             group_responses = calculations.format_outcomes_for_plots(group_responses, outcome_type, effect_type)
 
-            response_plot = plots.group_response_forest(
+            response_plot = _cached_group_response_forest(
                 data=group_responses,
                 outcome_type=outcome_type,
             )
@@ -123,13 +135,17 @@ def show_significance(outcome_type:OutcomeType) -> None:
             st.plotly_chart(response_plot, width="stretch")
 
         else:
-            st.write("#### :red[Experiment Summary Error:]")
-            st.write(":red[All sample sizes must be great than 0 for each group.]")
-
             if outcome_type == "binary":
-                st.write(":red[The number of successes must be greater than 0 for each group.]")
+                outcome_requirements = ":red[The number of successes must be greater than 0 for each group.]\n\n"
             else:
-                st.write(":red[The mean must be greater than 0 for each group.]")
-                st.write(":red[The standard deviation must be greater than 0 for each group.]")
+                outcome_requirements = (
+                    ":red[The mean must be greater than 0 for each group.]\n\n"
+                    + ":red[The standard deviation must be greater than 0 for each group.]\n\n"
+                )
 
-            st.write(":red[Please change the input to meet these specifications.]")
\ No newline at end of file
+            st.markdown(
+                "#### :red[Experiment Summary Error:]\n\n"
+                + ":red[All sample sizes must be great than 0 for each group.]\n\n"
+                + outcome_requirements
+                + ":red[Please change the input to meet these specifications.]"
+            )
\ No newline at end of file
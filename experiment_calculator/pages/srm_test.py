@@ -1,28 +1,68 @@
 import streamlit as st
+from typing import Tuple
 import pandas as pd
 from pathlib import Path
 from experiment_calculator.core import calculations, validation
 from experiment_calculator.ui import components
 
+_DEFAULT_DATA = pd.DataFrame(
+    [
+        {"Sample Size": 1_000, "Expected Proportion (%)": 50},
+        {"Sample Size": 1_000, "Expected Proportion (%)": 50}
+    ]
+)
+
+_UI_DIR = Path(__file__).resolve().parents[1] / "ui"
+_CHECKED_IMAGE = str(_UI_DIR / "checked.png")
+_CANCEL_IMAGE = str(_UI_DIR / "cancel.png")
+
+def _srm_result(sample_sizes:pd.DataFrame, threshold:float) -> Tuple[bool, str, str]:
+    """
+    Validate the SRM input table and build the result text and image path.
+    """
+    if not validation.valid_srm_data(sample_sizes):
+        return False, "", ""
+
+    sample_sizes = sample_sizes.assign(**{"Expected Proportion": sample_sizes["Expected Proportion (%)"] / 100})
+    p_value = calculations.srm_pvalue(sample_sizes)
+    
+    if p_value < 0.00001:
+        formatted_p_val = f"P value < 0.00001"
+    else:
+        formatted_p_val = f"P value = {round(p_value, 5):.5f}"
+
+    if p_value > threshold:
+        image_path = _CHECKED_IMAGE
+        result_text = (
+            "### :green[There is no sample ratio mismatch error]\n"
+            + f"#### {formatted_p_val}"
+        )
+    else:
+        image_path = _CANCEL_IMAGE
+        result_text = (
+            "### :red[There is a sample ratio mismatch error]\n"
+            + f"#### {formatted_p_val}"
+        )
+
+    return True, result_text, image_path
+
 def show_srm_test() -> None:
     st.header("Sample Ratio Mismatch Test")
     st.markdown("") # Extra space for formatting
 
+    _srm_calculator()
+
+# a fragment, so that editing the inputs only reruns the calculator rather than the whole app
+@st.fragment
+def _srm_calculator() -> None:
     col1, spacer, col2 = st.columns([2, 0.2, 3])
 
     with col1:
         st.write("**Expected proportions and actual counts form each experiment group**")
         st.write(components.input_table_instructions())
 
-        default_data = pd.DataFrame(
-            [
-                {"Sample Size": 1_000, "Expected Proportion (%)": 50},
-                {"Sample Size": 1_000, "Expected Proportion (%)": 50}
-            ]
-        )
-
-        sample_sizes = st.data_editor(default_data, num_rows="dynamic", hide_index=True)
-        sample_sizes_are_valid = validation.valid_srm_data(sample_sizes.dropna())
+        # rows added but left incomplete in the data editor are ignored
+        sample_sizes = st.data_editor(_DEFAULT_DATA.copy(), num_rows="dynamic", hide_index=True).dropna()
 
         threshold = st.number_input(
             label="**P-value threshold for sample ratio mismatch**",
@@ -33,30 +73,10 @@ def show_srm_test() -> None:
             format="%0.3f",
         )
 
+    sample_sizes_are_valid, result_text, image_path = _srm_result(sample_sizes, threshold)
+
     with col2:
         if sample_sizes_are_valid:
-            sample_sizes["Expected Proportion"] = sample_sizes["Expected Proportion (%)"] / 100
-            p_value = calculations.srm_pvalue(sample_sizes.dropna())
-            
-            if p_value < 0.00001:
-                formatted_p_val = f"P value < 0.00001"
-            else:
-                formatted_p_val = f"P value = {round(p_value, 5):.5f}"
-
-            root_dir = Path(__file__).parents[1]
-            if p_value > threshold:
-                image_path = str(root_dir / "ui" / "checked.png")
-                result_text = (
-                    "### :green[There is no sample ratio mismatch error]\n"
-                    + f"#### {formatted_p_val}"
-                )
-            else:
-                image_path = str(root_dir / "ui" / "cancel.png")
-                result_text = (
-                    "### :red[There is a sample ratio mismatch error]\n"
-                    + f"#### {formatted_p_val}"
-                )
-
             st.write(result_text)
 
             image_col1, image_col2, image_col3 = st.columns([1,3,1])
@@ -65,8 +85,9 @@ def show_srm_test() -> None:
                 st.image(image_path, width='content')
         
         else:
-            st.write("#### :red[Sample Input Error:]")
-            st.write(":red[Sample sizes for each individual group must be between 1% and 100%.]")
-            st.write(":red[Total expected proportions must be 100% or less.]")
-            st.write(":red[Please change the input to meet these specifications.]")
-
+            st.markdown(
+                "#### :red[Sample Input Error:]\n\n"
+                + ":red[Sample sizes for each individual group must be between 1% and 100%.]\n\n"
+                + ":red[Total expected proportions must be 100% or less.]\n\n"
+                + ":red[Please change the input to meet these specifications.]"
+            )
@@ -0,0 +1,32 @@
+from typing import Callable
+import pandas as pd
+import streamlit as st
+
+CACHE_ENTRIES = 128
+
+def _hash_dataframe(data:pd.DataFrame) -> tuple:
+    # column labels are part of the key as hash_pandas_object only hashes the rows
+    return tuple(data.columns), pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes()
+
+def _hash_series(data:pd.Series) -> tuple:
+    return data.name, pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes()
+
+_HASH_FUNCS = {pd.DataFrame: _hash_dataframe, pd.Series: _hash_series}
+
+def cache_calculation(func:Callable) -> Callable:
+    """
+    Wrap a pure calculation (or figure builder) with st.cache_data so that
+    Streamlit reruns with unchanged inputs reuse the previous result.
+
+    Parameters
+    ----------
+    func : Callable
+        The calculation to be cached. Its result must be picklable.
+
+    Returns
+    -------
+    Callable
+        Cached version of the calculation. DataFrame and Series arguments are
+        keyed on their vectorised pandas hash rather than a pickled copy.
+    """
+    return st.cache_data(max_entries=CACHE_ENTRIES, hash_funcs=_HASH_FUNCS)(func)
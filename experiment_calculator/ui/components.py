@@ -2,6 +2,31 @@ import streamlit as st
 import pandas as pd
 from experiment_calculator.core.types import OutcomeType, EffectType
 
+# default input tables are built once and copied into the data editors
+_DEFAULT_TRAFFIC_DATA = pd.DataFrame(
+    [
+        {"Group Name": "Group 1", "Traffic Allocation (%)": 50},
+        {"Group Name": "Group 2", "Traffic Allocation (%)": 50}
+    ]
+)
+_DEFAULT_NORMAL_RESULTS = pd.DataFrame(
+    [
+        {"Group Name": "Group 1", "Sample Size": 1_000, "Mean": 4.0, "StdDev": 2.0},
+        {"Group Name": "Group 2", "Sample Size": 1_000, "Mean": 5.0, "StdDev": 2.0},
+    ]
+)
+_DEFAULT_BINARY_RESULTS = pd.DataFrame(
+    [
+        {"Group Name": "Group 1", "Sample Size": 1_000, "Num Successes": 40},
+        {"Group Name": "Group 2", "Sample Size": 1_000, "Num Successes": 50},
+    ]
+)
+_DEFAULT_DURATION_DATA = pd.DataFrame(
+    [
+        {"Days Passed": 1, "Total Experiment Duration": 30},
+    ]
+)
+
 def calculation_type_selection():
     return st.radio(
         label="**What do you want to calculate?**",
@@ -38,13 +63,7 @@ def baseline_std_selection():
     )
 
 def sample_split_selection():
-    default_traffic_data = pd.DataFrame(
-            [
-                {"Group Name": "Group 1", "Traffic Allocation (%)": 50},
-                {"Group Name": "Group 2", "Traffic Allocation (%)": 50}
-            ]
-        )
-    return st.data_editor(default_traffic_data, num_rows="dynamic", hide_index=True)
+    return st.data_editor(_DEFAULT_TRAFFIC_DATA.copy(), num_rows="dynamic", hide_index=True)
 
 def effect_type_selection():
     return st.radio(
@@ -153,20 +172,10 @@ def format_sample_size_results(
 
 def experiment_data_summary(outcome_type:OutcomeType):
     if outcome_type == "normal":
-            default_results = pd.DataFrame(
-                [
-                    {"Group Name": "Group 1", "Sample Size": 1_000, "Mean": 4.0, "StdDev": 2.0},
-                    {"Group Name": "Group 2", "Sample Size": 1_000, "Mean": 5.0, "StdDev": 2.0},
-                ]
-            )
+        default_results = _DEFAULT_NORMAL_RESULTS
     else:
-        default_results = pd.DataFrame(
-            [
-                {"Group Name": "Group 1", "Sample Size": 1_000, "Num Successes": 40},
-                {"Group Name": "Group 2", "Sample Size": 1_000, "Num Successes": 50},
-            ]
-        )
-    return st.data_editor(default_results, num_rows="dynamic", hide_index=True)
+        default_results = _DEFAULT_BINARY_RESULTS
+    return st.data_editor(default_results.copy(), num_rows="dynamic", hide_index=True)
 
 def sequential_testing_selection():
     return st.radio(
@@ -177,12 +186,7 @@ def sequential_testing_selection():
     )
 
 def experiment_duration_summary():
-    default_data = pd.DataFrame(
-        [
-            {"Days Passed": 1, "Total Experiment Duration": 30},
-        ]
-    )
-    return st.data_editor(default_data, hide_index=True)
+    return st.data_editor(_DEFAULT_DURATION_DATA.copy(), hide_index=True)
 
 def input_table_instructions():
     return (
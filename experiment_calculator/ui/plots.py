@@ -1,10 +1,31 @@
-from typing import Union
+from typing import Union, Tuple
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.colors as pc
 from experiment_calculator.core.types import OutcomeType, CalculationType, EffectType
 
+# shared styling for the forest plot axes and layout (plotly copies these, so they are never mutated)
+_FOREST_AXIS_STYLE = dict(
+    title_font=dict(size=20), 
+    tickfont=dict(size=18),
+    showline=True, 
+    linecolor='lightgrey', 
+    linewidth=1, 
+    showgrid=False,
+)
+_FOREST_LAYOUT_BASE = dict(
+    showlegend=False,
+    template='plotly_white',
+)
+
+@lru_cache(maxsize=32)
+def _response_colours(num_groups:int) -> Tuple[str, ...]:
+    colors = pc.qualitative.Plotly
+    # i+2 to choose nicer colours
+    return tuple(colors[(i + 2) % len(colors)] for i in range(num_groups))
+
 def power_curve(
     calculation_type:CalculationType,
     x_data:Union[list, np.ndarray],
@@ -22,15 +43,20 @@ def power_curve(
     title = f"Power Curve for the {x_label} for a {outcome_type.title()} Outcome"
     hover_template = f"Power: %{{y}}%<br>{hover_label}: %{{x:,}}"
 
+    # convert once so that plotly can serialise the curve without iterating lists
+    x_values = np.ascontiguousarray(x_data, dtype=np.float64)
+    power_values = np.ascontiguousarray(power_percents, dtype=np.float64)
+
     # find the corresponding location on the x-axis for the target power
-    marker_x_value = x_data[power_percents.index(target_power_level)]
+    marker_index = int(np.abs(power_values - target_power_level).argmin())
+    marker_x_value = x_values[marker_index]
 
     # Create the power curve plot
     fig = go.Figure()
 
     fig.add_trace(go.Scatter(
-        x=x_data,
-        y=power_percents,
+        x=x_values,
+        y=power_values,
         mode='lines',
         line=dict(color='royalblue', width=4),
         name=f'{x_label}',
@@ -41,8 +67,8 @@ def power_curve(
 
     # Add a marker for target power
     fig.add_trace(go.Scatter(
-        x=[marker_x_value],
-        y=[target_power_level],
+        x=np.array([marker_x_value]),
+        y=np.array([target_power_level], dtype=np.float64),
         mode='markers',
         marker=dict(size=14, color='coral'),
         name=f'{x_label} for {target_power_level}% Power',
@@ -53,8 +79,8 @@ def power_curve(
 
     # Add horizontal and vertical trace lines for target power
     fig.add_trace(go.Scatter(
-        x=[0, marker_x_value],
-        y=[target_power_level, target_power_level],
+        x=np.array([0.0, marker_x_value]),
+        y=np.full(2, target_power_level, dtype=np.float64),
         mode='lines',
         line=dict(color='coral', dash='dash', width=4),
         name=f'Sample Size for {target_power_level}% Power',
@@ -62,8 +88,8 @@ def power_curve(
     ))
 
     fig.add_trace(go.Scatter(
-        x=[marker_x_value, marker_x_value],
-        y=[0, target_power_level],
+        x=np.full(2, marker_x_value),
+        y=np.array([0.0, target_power_level]),
         mode='lines',
         line=dict(color='coral', dash='dash', width=4),
         name=f'Sample Size for {target_power_level}% Power',
@@ -77,7 +103,7 @@ def power_curve(
         yaxis_title="Power (%)",
         template="plotly_white",
         yaxis=dict(showline=True, linecolor='grey', linewidth=1, range=[0, 100], title_font=dict(size=24), tickfont=dict(size=18)), # Display the x-axis line
-        xaxis=dict(showline=True, linecolor='grey', linewidth=1, range=[0,max(x_data)], title_font=dict(size=24), tickfont=dict(size=18)),
+        xaxis=dict(showline=True, linecolor='grey', linewidth=1, range=[0,np.nanmax(x_values)], title_font=dict(size=24), tickfont=dict(size=18)),
         height=550,
         autosize=True,
     )
@@ -90,44 +116,48 @@ def group_difference_forest(
     effect_type:EffectType,
 ) -> go.Figure:
 
-    data["error"] = (data["ci_upper"] - data["ci_lower"]) / 2
-    data_reversed = data.iloc[::-1].reset_index(drop=True)
+    # reversed views so that the first comparison is plotted at the top
+    point_estimates = data["point_estimate"].to_numpy()[::-1]
+    ci_lower = data["ci_lower"].to_numpy()[::-1]
+    ci_upper = data["ci_upper"].to_numpy()[::-1]
+    group_names = data["group_name"].to_numpy()[::-1]
+    errors = (ci_upper - ci_lower) * 0.5
+    positions = np.arange(len(point_estimates))
+
+    # set colours based on result significance and direction
+    line_colours = np.where(
+        ci_lower > 0,
+        'royalblue',
+        np.where(ci_upper < 0, 'coral', 'lightgrey'),
+    )
 
     # create figure
     fig = go.Figure()
 
-    for i, row in data_reversed.iterrows():
-        
-        # set colours based on result significance and direction
-        if row["ci_lower"] > 0:
-            line_colour = 'royalblue'
-        elif row["ci_upper"] < 0:
-            line_colour = 'coral' 
-        else:
-            line_colour = 'lightgrey'
+    # error bar colours can't vary within a trace, so add one trace per colour
+    for line_colour in ('royalblue', 'coral', 'lightgrey'):
+        in_group = line_colours == line_colour
+        if not in_group.any():
+            continue
 
-        # main plot with error bars
+        # main plot with error bars and a dark line around the points
         fig.add_trace(go.Scatter(
-            x=[row["point_estimate"]],
-            y=[i],
+            x=point_estimates[in_group],
+            y=positions[in_group],
             mode='markers',
-            marker=dict(color='white', size=20, symbol='circle'),
+            marker=dict(color='white', size=20, symbol='circle', line=dict(width=3, color="black")),
             error_x=dict(
                 type='data',
                 symmetric=True,
-                array=[row['error']],
+                array=errors[in_group],
                 color=line_colour, 
                 thickness=8,
             ),
-            name=row['group_name'],
+            text=group_names[in_group],
+            hovertemplate="(%{x}, %{y})<extra>%{text}</extra>",
             hoverlabel=dict(font=dict(size=20)),
         ))
 
-    # update marker with dark line around the point 
-    fig.update_traces(
-        marker=dict(size=20, symbol="circle", line=dict(width=3, color="black"))
-    )
-
     # zero reference line
     fig.add_vline(x=0, line=dict(color='red', dash='dash'))
 
@@ -141,29 +171,11 @@ def group_difference_forest(
 
     # customise plot
     fig.update_layout(
+        **_FOREST_LAYOUT_BASE,
         title='Difference in Outcome Between Groups',
         xaxis_title=x_axis_label,
-        yaxis=dict(
-            title_font=dict(size=20), 
-            tickfont=dict(size=18),   
-            tickvals=list(range(len(data_reversed))), 
-            ticktext=data_reversed['group_name'], 
-            showline=True, 
-            linecolor='lightgrey', 
-            linewidth=1, 
-            showgrid=False, 
-            zeroline=False
-        ),
-        xaxis=dict(
-            title_font=dict(size=20), 
-            tickfont=dict(size=18),
-            showline=True, 
-            linecolor='lightgrey', 
-            linewidth=1,
-            showgrid=False
-        ),
-        showlegend=False,
-        template='plotly_white'
+        yaxis=dict(_FOREST_AXIS_STYLE, tickvals=positions, ticktext=group_names, zeroline=False),
+        xaxis=_FOREST_AXIS_STYLE,
     )
     
     return fig
@@ -173,35 +185,34 @@ def group_response_forest(
     outcome_type:OutcomeType,
 ) -> go.Figure:
 
-    data["error"] = (data["ci_upper"] - data["ci_lower"]) / 2
+    errors = (data["ci_upper"].to_numpy() - data["ci_lower"].to_numpy()) * 0.5
 
-    colors = pc.qualitative.Plotly
+    positions = np.arange(len(data))
 
-    # Create figure with one trace per study
+    # Create figure with a single trace for all groups
     fig = go.Figure()
 
-    for i, row in data.iterrows():
-        
-        # main plot with error bars
-        fig.add_trace(go.Scatter(
-            x=[row['point_estimate']],
-            y=[i],
-            mode='markers',
-            marker=dict(
-                symbol='circle', 
-                size=20, 
-                color=colors[(i + 2) % len(colors)], # i+2 to choose nicer colours
-            ),  
-            error_x=dict(
-                type='data', 
-                array=[row['error']], 
-                thickness=8, 
-                width=0, 
-                color='lightgrey',
-            ),
-            name=row['group_name'],
-            hoverlabel=dict(font=dict(size=20)),
-        ))
+    # main plot with error bars
+    fig.add_trace(go.Scatter(
+        x=data['point_estimate'].to_numpy(),
+        y=positions,
+        mode='markers',
+        marker=dict(
+            symbol='circle', 
+            size=20, 
+            color=_response_colours(len(data)),
+        ),  
+        error_x=dict(
+            type='data', 
+            array=errors, 
+            thickness=8, 
+            width=0, 
+            color='lightgrey',
+        ),
+        text=data['group_name'].to_numpy(),
+        hovertemplate="(%{x}, %{y})<extra>%{text}</extra>",
+        hoverlabel=dict(font=dict(size=20)),
+    ))
     
     if outcome_type == "binary":
         x_axis_label = "Response Rate"
@@ -210,31 +221,18 @@ def group_response_forest(
 
     # customise plot
     fig.update_layout(
+        **_FOREST_LAYOUT_BASE,
         title='Group Responses with Confidence Intervals',
         xaxis_title=x_axis_label,
-        xaxis=dict(
-            title_font=dict(size=20), 
-            tickfont=dict(size=18),
-            showline=True, 
-            linecolor='lightgrey', 
-            linewidth=1, 
-            showgrid=False
-        ),
+        xaxis=_FOREST_AXIS_STYLE,
         yaxis=dict(
+            _FOREST_AXIS_STYLE,
             autorange="reversed",
-            title_font=dict(size=20), 
-            tickfont=dict(size=18),
-            tickvals=list(range(len(data))), 
-            ticktext=data['group_name'], 
-            showline=True, 
-            linecolor='lightgrey', 
-            linewidth=1, 
-            showgrid=False, 
-            zeroline=False
+            tickvals=positions, 
+            ticktext=data['group_name'].to_numpy(), 
+            zeroline=False,
         ),
         height=400,
-        showlegend=False,
-        template='plotly_white',
     )
 
     return fig
\ No newline at end of file
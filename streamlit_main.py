@@ -4,9 +4,9 @@ from experiment_calculator.pages import show_power, show_significance, show_srm_
 
 st.set_page_config(layout="wide", initial_sidebar_state="collapsed")
 
-pages = ["Power - Binary", "Power - Normal", "Significance - Binary", "Significance - Normal", "SRM Test"]
+PAGES = ["Power - Binary", "Power - Normal", "Significance - Binary", "Significance - Normal", "SRM Test"]
 
-styles = {
+STYLES = {
     "nav": {
         "background-color": "royalblue",
         "font-size": "large",
@@ -26,18 +26,13 @@ styles = {
         "padding": "14px",
     }
 }
-options = {
+
+OPTIONS = {
     "show_menu": False,
     "show_sidebar": False,
 }
 
-page = st_navbar(
-    pages,
-    styles=styles,
-    options=options,
-)
-
-functions = {
+PAGE_FUNCTIONS = {
     "Power - Binary": (show_power, "binary"),
     "Power - Normal": (show_power, "normal"),
     "Significance - Binary": (show_significance, "binary"),
@@ -45,10 +40,16 @@ functions = {
     "SRM Test": (show_srm_test, None),
 }
 
-go_to, arg = functions.get(page, (None, None))
+page = st_navbar(
+    PAGES,
+    styles=STYLES,
+    options=OPTIONS,
+)
+
+go_to, arg = PAGE_FUNCTIONS.get(page, (None, None))
 
 if go_to:
     if arg:
         go_to(arg)
-    else: 
-        go_to()
\ No newline at end of file
+    else:
+        go_to()
@@ -1,6 +1,12 @@
 import pytest
+import numpy as np
+from statsmodels.stats.power import TTestIndPower, tt_ind_solve_power
 from experiment_calculator.core import calculations
 
+# power range used for the power curve on the power page
+POWER_RANGE = np.linspace(0.1, 0.99, 90)
+
+
 class TestCrossValidation:
     """Verify different calculation methods produce consistent results"""
     
@@ -50,7 +56,7 @@ class TestCrossValidation:
         )
         
         # With large samples and real effect, CI should exclude zero
-        assert result["ci_lower"][0] > 0
+        assert result["ci_lower"] > 0
         
         # Now test with smaller effect that might not be significant
         prop2_small = 0.105  # 0.5 percentage points
@@ -60,7 +66,7 @@ class TestCrossValidation:
         
         # This might cross zero (not significant)
         # Just verify it's a valid CI
-        assert result_small["ci_lower"][0] < result_small["ci_upper"][0]
+        assert result_small["ci_lower"] < result_small["ci_upper"]
     
     def test_bonferroni_equals_divided_alpha(self):
         """Bonferroni adjustment should equal alpha/k for all k"""
@@ -91,4 +97,98 @@ class TestCrossValidation:
         total_equal = n1_equal * 2
         total_unequal = n1_unequal * 3  # n1 + 2*n1
         
-        assert total_unequal > total_equal
\ No newline at end of file
+        assert total_unequal > total_equal
+
+
+class TestPowerCurveMatchesStatsmodels:
+    """Power curve solvers should agree with statsmodels point by point"""
+
+    @pytest.mark.parametrize("alternative", ["two-sided", "larger", "smaller"])
+    @pytest.mark.parametrize("ratio", [0.5, 1.0, 2.0])
+    @pytest.mark.parametrize("effect", [0.1, 0.3])
+    def test_sample_size_list_matches_statsmodels(self, effect, ratio, alternative):
+        """Each curve point should be the statsmodels sample size, rounded up"""
+        if alternative == "smaller":
+            effect = -effect
+
+        sample_sizes = calculations.sample_size_list(
+            effect_size=effect,
+            power_range=POWER_RANGE,
+            alpha=0.05,
+            limiting_ratio=ratio,
+            flight_ratios=[1.0],
+            alternative=alternative,
+        )
+        expected = [
+            np.ceil(float(np.squeeze(tt_ind_solve_power(effect, None, 0.05, power, ratio, alternative))))
+            for power in POWER_RANGE
+        ]
+
+        assert sample_sizes == expected
+
+    @pytest.mark.parametrize("alternative", ["two-sided", "larger"])
+    @pytest.mark.parametrize("ratio", [0.5, 1.0, 2.0])
+    @pytest.mark.parametrize("nobs1", [50, 500])
+    def test_effect_size_list_matches_statsmodels(self, nobs1, ratio, alternative):
+        """Each curve point should be the statsmodels minimum detectable effect"""
+        baseline_stdev = 1000.0  # scales the effect sizes past the 3 decimal rounding
+
+        effect_sizes = calculations.effect_size_list(
+            nobs1=nobs1,
+            power_range=POWER_RANGE,
+            alpha=0.05,
+            limiting_ratio=ratio,
+            outcome_type="normal",
+            effect_type="Absolute Effect",
+            baseline_mean=0.0,
+            baseline_stdev=baseline_stdev,
+            alternative=alternative,
+        )
+        # statsmodels sometimes returns 1-element arrays, and as the two-sided test
+        # is symmetric it may return either root
+        expected = [
+            abs(float(np.squeeze(tt_ind_solve_power(None, nobs1, 0.05, power, ratio, alternative)))) * baseline_stdev
+            for power in POWER_RANGE
+        ]
+
+        # statsmodels' root finder stops within about 1e-5 of the root
+        assert effect_sizes == pytest.approx(expected, rel=1e-4, abs=1e-3)
+
+    @pytest.mark.parametrize("alternative", ["two-sided", "larger", "smaller"])
+    @pytest.mark.parametrize("ratio", [0.5, 1.0, 2.0])
+    def test_effect_size_list_reaches_target_power(self, ratio, alternative):
+        """Statsmodels' power at each curve point should be the target power"""
+        # statsmodels' solver picks the wrong bracket for some 'smaller' targets,
+        # so its power function is the reference here
+        effect_sizes = calculations.effect_size_list(
+            nobs1=500,
+            power_range=POWER_RANGE,
+            alpha=0.05,
+            limiting_ratio=ratio,
+            outcome_type="normal",
+            effect_type="Absolute Effect",
+            baseline_mean=0.0,
+            baseline_stdev=1000.0,
+            alternative=alternative,
+        )
+        achieved_power = TTestIndPower().power(
+            effect_size=np.asarray(effect_sizes) / 1000.0, nobs1=500, alpha=0.05, ratio=ratio, alternative=alternative,
+        )
+
+        assert achieved_power == pytest.approx(POWER_RANGE, abs=1e-4)
+
+    def test_effect_size_list_is_zero_when_power_equals_alpha(self):
+        """A target power equal to alpha is met with no effect"""
+        effect_sizes = calculations.effect_size_list(
+            nobs1=500,
+            power_range=[0.05, 0.5],
+            alpha=0.05,
+            limiting_ratio=1.0,
+            outcome_type="normal",
+            effect_type="Absolute Effect",
+            baseline_mean=0.0,
+            baseline_stdev=1.0,
+        )
+
+        assert effect_sizes[0] == 0
+        assert effect_sizes[1] > 0
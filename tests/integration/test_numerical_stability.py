@@ -72,6 +72,6 @@ class TestNumericalStability:
             effect_type="Absolute Effect"
         )
         
-        assert np.isfinite(result["ci_lower"][0])
-        assert np.isfinite(result["ci_upper"][0])
-        assert result["ci_lower"][0] < result["ci_upper"][0]
\ No newline at end of file
+        assert np.isfinite(result["ci_lower"])
+        assert np.isfinite(result["ci_upper"])
+        assert result["ci_lower"] < result["ci_upper"]
\ No newline at end of file
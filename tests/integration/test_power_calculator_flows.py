@@ -81,11 +81,34 @@ class TestPowerCalculatorBinaryFlow:
         n1 = calculations.n1_sample_size(effect, 0.05, 0.8, ratio)
         
         # Total sample should be sum of all groups
-        total_sample = n1 * sum(calculation_ratios)
+        total_sample = n1 * calculation_ratios.sum()
         
         assert total_sample > n1  # Multi-group requires more samples
         assert ratio < 1  # Limiting ratio for unequal allocation
 
+    @pytest.mark.parametrize("traffic_allocation", [[50, 50], [40, 30, 30], [20, 80]])
+    def test_power_curve_matches_total_samples_required(self, traffic_allocation):
+        """The curve point at the selected power should equal the headline total"""
+        calculation_ratios = pd.Series(traffic_allocation, dtype=float) / traffic_allocation[0]
+        ratio = calculations.design_ratio(calculation_ratios)
+        effect = calculations.effect_size("binary", "Relative Effect", 0.1, 0.1)
+        power_range = np.linspace(0.1, 0.99, 90)
+
+        # Headline total, built as on the power page
+        n1 = calculations.n1_sample_size(effect, 0.05, 0.8, ratio)
+        total_samples_required = np.ceil(calculation_ratios * n1).sum()
+
+        sample_sizes = calculations.sample_size_list(
+            effect_size=effect,
+            power_range=power_range,
+            alpha=0.05,
+            limiting_ratio=ratio,
+            flight_ratios=calculation_ratios,
+        )
+
+        selected = int(np.argmin(np.abs(power_range - 0.8)))
+        assert sample_sizes[selected] == total_samples_required
+
 class TestPowerCalculatorNormalFlow:
     """Test complete power calculation workflow for normal outcomes"""
     
@@ -4,7 +4,7 @@ import pandas as pd
 from scipy import stats
 from statsmodels.stats.power import tt_ind_solve_power
 from experiment_calculator.core.calculations import (
-    adjusted_alpha, effect_size, n1_sample_size, 
+    adjusted_alpha, obrien_fleming_correction, effect_size, n1_sample_size, 
     minimum_detectable_effect_size, binomial_confidence_interval,
     normal_confidence_interval, srm_pvalue
 )
@@ -20,6 +20,11 @@ class TestAlphaAdjustments:
         alpha = adjusted_alpha(0.05, num_comparisons=5, multiple_comparisons="None")
         assert alpha == 0.05
     
+    def test_invalid_number_of_comparisons(self):
+        """Fewer than one comparison should raise an error"""
+        with pytest.raises(ValueError):
+            adjusted_alpha(0.05, num_comparisons=0, multiple_comparisons="None")
+    
     def test_obrien_fleming_reduces_alpha(self):
         """O'Brien-Fleming should reduce alpha at early information fractions"""
         alpha_early = adjusted_alpha(
@@ -27,6 +32,16 @@ class TestAlphaAdjustments:
         )
         assert alpha_early < 0.05
 
+    def test_obrien_fleming_accepts_array_of_fractions(self):
+        """Vectorised O'Brien-Fleming should match scalar calls, spending nothing at t=0"""
+        fractions = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+        alphas = obrien_fleming_correction(fractions, alpha=0.05)
+
+        assert alphas[0] == 0.0
+        assert alphas[-1] == pytest.approx(0.05)
+        for fraction, alpha in zip(fractions[1:], alphas[1:]):
+            assert alpha == pytest.approx(obrien_fleming_correction(fraction, alpha=0.05))
+
 class TestEffectSizeCalculations:
     def test_binary_absolute_effect_size(self):
         """Binary absolute effect should match statsmodels"""
@@ -81,7 +96,19 @@ class TestSampleSizeCalculations:
         expected = tt_ind_solve_power(effect, None, alpha, power, ratio, "two-sided")
         
         assert result == pytest.approx(np.ceil(expected))
-    
+
+    @pytest.mark.parametrize("effect,alpha,power,ratio,alternative", [
+        (0.3, 0.01, 0.95, 2.0, "two-sided"),
+        (0.5, 0.05, 0.9, 0.5, "larger"),
+        (0.15, 0.1, 0.15, 1.0, "two-sided"),  # low power, where the second tail matters
+    ])
+    def test_sample_size_matches_statsmodels_across_designs(self, effect, alpha, power, ratio, alternative):
+        """Sample size should match statsmodels for other designs and alternatives"""
+        result = n1_sample_size(effect, alpha, power, ratio, alternative)
+        expected = tt_ind_solve_power(effect, None, alpha, power, ratio, alternative)
+
+        assert result == np.ceil(expected)
+
     def test_sample_size_increases_with_smaller_effect(self):
         """Smaller effects require larger samples"""
         n_small_effect = n1_sample_size(0.1, 0.05, 0.8, 1.0)
@@ -110,22 +137,50 @@ class TestConfidenceIntervals:
         
         result = binomial_confidence_interval(prop1, n1, prop2, n2, 0.95, "Absolute Effect")
         
-        assert result["ci_lower"][0] < true_diff < result["ci_upper"][0]
+        assert result["ci_lower"] < true_diff < result["ci_upper"]
     
     def test_normal_ci_width_decreases_with_sample_size(self):
         """Larger samples should produce narrower CIs"""
         ci_small = normal_confidence_interval(100, 15, 100, 105, 15, 100, 0.95, "Absolute Effect")
         ci_large = normal_confidence_interval(100, 15, 10000, 105, 15, 10000, 0.95, "Absolute Effect")
         
-        width_small = ci_small["ci_upper"][0] - ci_small["ci_lower"][0]
-        width_large = ci_large["ci_upper"][0] - ci_large["ci_lower"][0]
+        width_small = ci_small["ci_upper"] - ci_small["ci_lower"]
+        width_large = ci_large["ci_upper"] - ci_large["ci_lower"]
         
         assert width_large < width_small
     
     def test_ci_excludes_zero_for_large_difference(self):
         """Large true difference should produce CI excluding zero"""
         result = binomial_confidence_interval(0.1, 1000, 0.2, 1000, 0.95, "Absolute Effect")
-        assert result["ci_lower"][0] > 0
+        assert result["ci_lower"] > 0
+
+    @pytest.mark.parametrize("effect_type", ["Absolute Effect", "Relative Effect"])
+    def test_binomial_ci_arrays_match_scalar(self, effect_type):
+        """Array inputs should give the same intervals as one scalar call per pair"""
+        prop1 = np.array([0.1, 0.1, 0.15])
+        n1 = np.array([1000, 1000, 500])
+        prop2 = np.array([0.15, 0.2, 0.2])
+        n2 = np.array([1000, 800, 500])
+
+        result = binomial_confidence_interval(prop1, n1, prop2, n2, 0.95, effect_type)
+
+        for i in range(len(prop1)):
+            expected = binomial_confidence_interval(prop1[i], n1[i], prop2[i], n2[i], 0.95, effect_type)
+            assert result["ci_lower"][i] == pytest.approx(expected["ci_lower"])
+            assert result["ci_upper"][i] == pytest.approx(expected["ci_upper"])
+
+    def test_binomial_ci_arrays_match_known_intervals(self):
+        """Array inputs should give the hand-calculated Wald intervals"""
+        result = binomial_confidence_interval(
+            np.array([0.1, 0.1]), np.array([1000, 1000]),
+            np.array([0.15, 0.2]), np.array([1000, 800]),
+            0.95, "Absolute Effect",
+        )
+
+        # (p2 - p1) ± 1.95996 * sqrt(p1(1 - p1)/n1 + p2(1 - p2)/n2)
+        assert result["point_estimate"] == pytest.approx([0.05, 0.1])
+        assert result["ci_lower"] == pytest.approx([0.02109, 0.06662], abs=1e-5)
+        assert result["ci_upper"] == pytest.approx([0.07891, 0.13338], abs=1e-5)
 
 class TestSRMCalculations:
     def test_srm_no_mismatch_high_pvalue(self):
@@ -144,4 +199,25 @@ class TestSRMCalculations:
             "Expected Proportion": [0.5, 0.5]  # 50:50 expected
         })
         p_value = srm_pvalue(data)
-        assert p_value < 0.001
\ No newline at end of file
+        assert p_value < 0.001
+
+    @pytest.mark.parametrize("sample_sizes,expected_proportions", [
+        ([500, 500], [0.5, 0.5]),
+        ([520, 480], [0.5, 0.5]),
+        ([2100, 7900], [0.2, 0.8]),
+        ([3300, 3350, 3350], [0.33, 0.33, 0.34]),
+        ([1000, 1100, 950, 980], [0.25, 0.25, 0.25, 0.25]),
+    ])
+    def test_srm_matches_proportions_chisquare(self, sample_sizes, expected_proportions):
+        """SRM p-value should match statsmodels' proportions_chisquare exactly"""
+        from statsmodels.stats.proportion import proportions_chisquare
+
+        data = pd.DataFrame({
+            "Sample Size": sample_sizes,
+            "Expected Proportion": expected_proportions,
+        })
+        expected = proportions_chisquare(
+            np.array(sample_sizes), sum(sample_sizes), np.array(expected_proportions)
+        )[1]
+
+        assert srm_pvalue(data) == pytest.approx(expected, rel=1e-12)